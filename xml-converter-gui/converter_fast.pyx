@@ -0,0 +1,76 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# converter_fast.pyx
+#
+# Compiled drop-in for converter_logic._py_emit_path. Build it in place with:
+#     python setup.py build_ext --inplace
+
+import sys
+
+
+cdef inline str _format_pair(double x, double y):
+    return f"{x:.4f} {y:.4f}"
+
+
+def emit_path(list elements, double scale, double height, double[::1] bbox_out, int path_number=0):
+    """
+    Converts the children of one cut-path into SVG path data.
+
+    Args:
+        elements (list): The point/spline elements of the cut path.
+        scale (float): Factor converting XML units to millimeters.
+        height (float): Canvas height in millimeters, used to flip the Y axis.
+        bbox_out (ndarray): [min_x, max_x, min_y, max_y], widened in place.
+        path_number (int): 1-based index of the path, used in warnings.
+
+    Returns:
+        str: The path data, or an empty string if the path has no valid elements.
+    """
+    cdef double x, y, x1, y1, x2, y2, x3, y3
+    cdef double min_x = bbox_out[0], max_x = bbox_out[1]
+    cdef double min_y = bbox_out[2], max_y = bbox_out[3]
+    cdef bint is_first = True
+    cdef list buf = []
+    cdef str tag
+
+    for element in elements:
+        tag_obj = element.tag
+        # Comments and processing instructions carry a function, not a str, as their tag
+        if type(tag_obj) is not str:
+            continue
+        tag = <str>tag_obj
+        get = element.get
+        try:
+            if tag == 'point':
+                x = float(get('x')) * scale
+                y = height - (float(get('y')) * scale)
+                buf.append(("M " if is_first else "L ") + _format_pair(x, y))
+                is_first = False
+                min_x = min(min_x, x)
+                max_x = max(max_x, x)
+                min_y = min(min_y, y)
+                max_y = max(max_y, y)
+            elif tag == 'spline':
+                x1 = float(get('x1')) * scale
+                y1 = height - (float(get('y1')) * scale)
+                x2 = float(get('x2')) * scale
+                y2 = height - (float(get('y2')) * scale)
+                x3 = float(get('x3')) * scale
+                y3 = height - (float(get('y3')) * scale)
+                buf.append("C " + _format_pair(x1, y1) + ", " + _format_pair(x2, y2) + ", " + _format_pair(x3, y3))
+                # Spline control points give a good approximation of the curve's extents
+                min_x = min(min_x, x1, x2, x3)
+                max_x = max(max_x, x1, x2, x3)
+                min_y = min(min_y, y1, y2, y3)
+                max_y = max(max_y, y1, y2, y3)
+        except (TypeError, ValueError):
+            print(f"Warning: Skipping an element in path {path_number} due to invalid coordinates.", file=sys.stderr)
+
+    if not buf:
+        return ""
+
+    bbox_out[0] = min_x
+    bbox_out[1] = max_x
+    bbox_out[2] = min_y
+    bbox_out[3] = max_y
+    buf.append("Z")
+    return " ".join(buf)
@@ -0,0 +1,133 @@
+# converter_kernels.py
+
+import math
+
+import numpy as np
+from numba import njit
+
+# Numbers are written with a fixed four decimal places, matching the '{:.4f}'
+# formatting used by the pure-Python path in converter_logic.py.
+FRACTION_DIGITS = 4
+FRACTION_SCALE = 10 ** FRACTION_DIGITS
+
+# Magnitude limit (exclusive) for the kernel, about 9.007e11. Scaled values must stay
+# below 2**53 for value * FRACTION_SCALE to keep integer precision; past that the
+# rounding below works from an already-rounded product and drifts from '{:.4f}'.
+# Callers should use the pure-Python formatter for anything at or above it.
+MAX_ABS_VALUE = 2 ** 53 / FRACTION_SCALE
+
+# Upper bound on the bytes written per coordinate: a pair of numbers of at most
+# 18 characters each (sign, 12 integer digits, '.', 4 decimals) joined by a space,
+# plus the command or ', ' before it and the space after it.
+BYTES_PER_COORDINATE = 40
+
+# Veltkamp splitter (2**27 + 1) for the error-free product in _product_error
+_SPLITTER = 134217729.0
+
+# Command code for a cubic Bezier segment; any other code ('M', 'L') takes one coordinate
+CMD_CURVE = ord('C')
+
+
+@njit(cache=True)
+def _product_error(a, b, product):
+    """Returns the rounding error of product = a * b, so that a * b == product + error exactly."""
+    t = _SPLITTER * a
+    a_hi = t - (t - a)
+    a_lo = a - a_hi
+    t = _SPLITTER * b
+    b_hi = t - (t - b)
+    b_lo = b - b_hi
+    return ((a_hi * b_hi - product) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+
+@njit(cache=True)
+def _write_number(value, out_buf, pos):
+    """Writes value with four decimal places into out_buf at pos; returns the new position."""
+    if math.copysign(1.0, value) < 0.0:
+        out_buf[pos] = 45  # '-'
+        pos += 1
+        value = -value
+
+    # Round the exact binary value half-to-even, like '{:.4f}' does. The product's
+    # rounding error only decides the outcome when its fractional part is exactly .5
+    product = value * FRACTION_SCALE
+    scaled = np.int64(math.floor(product))
+    remainder = product - scaled
+    if remainder > 0.5:
+        scaled += 1
+    elif remainder == 0.5:
+        error = _product_error(value, float(FRACTION_SCALE), product)
+        if error > 0.0 or (error == 0.0 and scaled % 2 == 1):
+            scaled += 1
+    whole = scaled // FRACTION_SCALE
+    fraction = scaled % FRACTION_SCALE
+
+    # Integer digits come out least significant first, so reverse them in place
+    start = pos
+    while True:
+        out_buf[pos] = 48 + whole % 10
+        pos += 1
+        whole //= 10
+        if whole == 0:
+            break
+    end = pos - 1
+    while start < end:
+        out_buf[start], out_buf[end] = out_buf[end], out_buf[start]
+        start += 1
+        end -= 1
+
+    out_buf[pos] = 46  # '.'
+    pos += 1
+    divisor = FRACTION_SCALE // 10
+    while divisor > 0:
+        out_buf[pos] = 48 + (fraction // divisor) % 10
+        pos += 1
+        divisor //= 10
+    return pos
+
+
+@njit(cache=True)
+def _write_pair(x, y, out_buf, pos):
+    """Writes an 'x y' coordinate pair into out_buf at pos; returns the new position."""
+    pos = _write_number(x, out_buf, pos)
+    out_buf[pos] = 32  # ' '
+    pos += 1
+    return _write_number(y, out_buf, pos)
+
+
+@njit(cache=True)
+def format_path(xs, ys, out_buf, cmds):
+    """
+    Writes SVG path data ('M x y L x y C x1 y1, x2 y2, x3 y3 ... Z') as ASCII.
+
+    Args:
+        xs (ndarray): Transformed x-coordinates (float64), in element order.
+        ys (ndarray): Transformed y-coordinates (float64), in element order.
+        out_buf (ndarray): Preallocated uint8 buffer of at least
+            len(xs) * BYTES_PER_COORDINATE + 2 bytes.
+        cmds (ndarray): uint8 command codes; a curve consumes three coordinates.
+
+    Returns:
+        int: The number of bytes written to out_buf.
+    """
+    pos = 0
+    i = 0
+    for c in range(cmds.shape[0]):
+        out_buf[pos] = cmds[c]
+        out_buf[pos + 1] = 32  # ' '
+        pos += 2
+        if cmds[c] == CMD_CURVE:
+            pos = _write_pair(xs[i], ys[i], out_buf, pos)
+            for k in range(1, 3):
+                out_buf[pos] = 44  # ','
+                out_buf[pos + 1] = 32
+                pos += 2
+                pos = _write_pair(xs[i + k], ys[i + k], out_buf, pos)
+            i += 3
+        else:
+            pos = _write_pair(xs[i], ys[i], out_buf, pos)
+            i += 1
+        out_buf[pos] = 32
+        pos += 1
+    out_buf[pos] = 90  # 'Z'
+    return pos + 1
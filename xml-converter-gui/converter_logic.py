@@ -1,7 +1,123 @@
 import xml.etree.ElementTree as ET
+import numpy as np
 import argparse
+import shutil
 import sys
 import os
+import tempfile
+
+try:
+    # Cython build of _py_emit_path; see converter_fast.pyx and setup.py
+    from converter_fast import emit_path
+except ImportError:
+    emit_path = None
+
+format_path = None
+if emit_path is None:
+    # Only _py_emit_path uses the kernels, so skip loading Numba when Cython replaces it
+    try:
+        # Numba-compiled formatter for path data; the pure-Python one below is used without it
+        from converter_kernels import format_path, MAX_ABS_VALUE, BYTES_PER_COORDINATE
+    except (ImportError, RuntimeError):
+        # Numba raises RuntimeError when it can't cache, e.g. no .py source in a frozen build
+        format_path = None
+
+# Bound str.format methods parse their format spec once, which is measurably
+# cheaper than re-evaluating an f-string with ':.4f' fields for every element
+_FORMAT_POINT = {
+    'M': "M {:.4f} {:.4f}".format,
+    'L': "L {:.4f} {:.4f}".format,
+}
+_FORMAT_SPLINE = "C {:.4f} {:.4f}, {:.4f} {:.4f}, {:.4f} {:.4f}".format
+
+def _format_path_data(commands, xs, ys):
+    """
+    Builds the SVG path data string for a cut path.
+
+    Args:
+        commands (list): 'M', 'L' or 'C' per element; 'C' consumes three coordinates.
+        xs (list): Transformed x-coordinates, in element order.
+        ys (list): Transformed y-coordinates, in element order.
+    """
+    format_point = _FORMAT_POINT
+    format_spline = _FORMAT_SPLINE
+    path_data = []
+    i = 0
+    for command in commands:
+        if command == 'C':
+            path_data.append(format_spline(xs[i], ys[i], xs[i + 1], ys[i + 1], xs[i + 2], ys[i + 2]))
+            i += 3
+        else:
+            path_data.append(format_point[command](xs[i], ys[i]))
+            i += 1
+    path_data.append("Z")
+    return " ".join(path_data)
+
+def _py_emit_path(elements, scale, height, bbox_out, path_number=0):
+    """
+    Converts the children of one cut-path into SVG path data.
+
+    Args:
+        elements (list): The point/spline elements of the cut path.
+        scale (float): Factor converting XML units to millimeters.
+        height (float): Canvas height in millimeters, used to flip the Y axis.
+        bbox_out (ndarray): [min_x, max_x, min_y, max_y], widened in place.
+        path_number (int): 1-based index of the path, used in warnings.
+
+    Returns:
+        str: The path data, or an empty string if the path has no valid elements.
+    """
+    # Collect the raw coordinates first so scaling and flipping run as array operations
+    commands, raw_x, raw_y = [], [], []
+    add_command, add_x, add_y = commands.append, raw_x.append, raw_y.append
+    is_first = True
+    for element in elements:
+        # Bind the attribute lookup once per element rather than once per attribute
+        get = element.get
+        tag = element.tag
+        try:
+            if tag == 'point':
+                point_x, point_y = float(get('x')), float(get('y'))
+                add_command("M" if is_first else "L")
+                add_x(point_x)
+                add_y(point_y)
+                is_first = False
+            elif tag == 'spline':
+                # Direct float() calls: the C parser beats any Python-level shortcut,
+                # so the only cost worth removing is the per-key comprehension overhead
+                x1, y1 = float(get('x1')), float(get('y1'))
+                x2, y2 = float(get('x2')), float(get('y2'))
+                x3, y3 = float(get('x3')), float(get('y3'))
+                add_command("C")
+                raw_x += (x1, x2, x3)
+                raw_y += (y1, y2, y3)
+        except (TypeError, ValueError):
+            print(f"Warning: Skipping an element in path {path_number} due to invalid coordinates.", file=sys.stderr)
+
+    if not commands:
+        return ""
+
+    # Scale and flip in place so each array is allocated once
+    xs = np.array(raw_x, dtype=np.float64)
+    ys = np.array(raw_y, dtype=np.float64)
+    xs *= scale
+    ys *= scale
+    np.subtract(height, ys, out=ys)
+    # Spline control points give a good approximation of the curve's extents
+    bbox_out[0] = min(bbox_out[0], xs.min())
+    bbox_out[1] = max(bbox_out[1], xs.max())
+    bbox_out[2] = min(bbox_out[2], ys.min())
+    bbox_out[3] = max(bbox_out[3], ys.max())
+    if (format_path is not None
+            and np.abs(xs).max() < MAX_ABS_VALUE and np.abs(ys).max() < MAX_ABS_VALUE):
+        cmds = np.frombuffer("".join(commands).encode('ascii'), dtype=np.uint8)
+        out_buf = np.empty(len(xs) * BYTES_PER_COORDINATE + 2, dtype=np.uint8)
+        n = format_path(xs, ys, out_buf, cmds)
+        return bytes(out_buf[:n]).decode('ascii')
+    return _format_path_data(commands, xs.tolist(), ys.tolist())
+
+if emit_path is None:
+    emit_path = _py_emit_path
 
 def convert_xml_to_svg(xml_file, svg_file):
     """
@@ -13,14 +129,19 @@ def convert_xml_to_svg(xml_file, svg_file):
         svg_file (str): The path for the output SVG file.
     """
     try:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
+        # Stream the file rather than building the whole tree: the root's attributes are
+        # complete on its 'start' event, and each top-level child is handled on its 'end'
+        context = ET.iterparse(xml_file, events=('start', 'end'))
+        _, root = next(context)
     except ET.ParseError as e:
         print(f"Error: Could not parse XML file. Details: {e}", file=sys.stderr)
         sys.exit(1)
     except FileNotFoundError:
         print(f"Error: Input file not found at '{xml_file}'", file=sys.stderr)
         sys.exit(1)
+    except OSError as e:
+        print(f"Error: Could not read input file '{xml_file}'. Details: {e}", file=sys.stderr)
+        sys.exit(1)
 
     # Determine the scaling factor
     units = root.get('units')
@@ -40,45 +161,65 @@ def convert_xml_to_svg(xml_file, svg_file):
         print("Error: Could not read 'width' or 'height' attributes.", file=sys.stderr)
         sys.exit(1)
 
-    # --- CENTERING CHANGE: First, pre-scan all points to find the drawing's bounding box ---
-    all_x_coords, all_y_coords = [], []
+    # --- Single pass: emit rects and paths while tracking the drawing's bounding box ---
+    # The centering transform lives on the enclosing <g>, so the emitted coordinates
+    # don't depend on it and the header can be assembled once the pass is done.
+    bbox = np.array([np.inf, -np.inf, np.inf, -np.inf])  # min_x, max_x, min_y, max_y
     reg_mark_size_mm = 3.0
+    half_mark = reg_mark_size_mm / 2
+    reg_rects = []  # (top_left_x, top_left_y) per valid registration mark
+    path_index = 0
+    # The <g> header needs the finished bounding box, so paths are streamed into a spool
+    # (held in memory up to 1 MiB, then on disk) and copied in behind the header at the end
+    path_spool = tempfile.SpooledTemporaryFile(max_size=1 << 20, mode='w+')
 
-    # Include registration marks in the bounding box
-    for mark in root.findall('reg-mark'):
-        try:
-            center_x = float(mark.get('x')) * scale_factor
-            center_y = height_mm - (float(mark.get('y')) * scale_factor)
-            all_x_coords.extend([center_x - reg_mark_size_mm / 2, center_x + reg_mark_size_mm / 2])
-            all_y_coords.extend([center_y - reg_mark_size_mm / 2, center_y + reg_mark_size_mm / 2])
-        except (TypeError, ValueError):
-            continue
-
-    # Include all path points in the bounding box
-    for path in root.findall('cut-path'):
-        for element in path:
-            try:
-                if element.tag == 'point':
-                    x = float(element.get('x')) * scale_factor
-                    y = height_mm - (float(element.get('y')) * scale_factor)
-                    all_x_coords.append(x)
-                    all_y_coords.append(y)
-                elif element.tag == 'spline':
-                    # Including control points gives a good approximation of the curve's extents
-                    for key in ['x1', 'x2', 'x3']:
-                        all_x_coords.append(float(element.get(key)) * scale_factor)
-                    for key in ['y1', 'y2', 'y3']:
-                        all_y_coords.append(height_mm - (float(element.get(key)) * scale_factor))
-            except (TypeError, ValueError):
+    depth = 1  # Inside the root element
+    try:
+        for event, child in context:
+            if event == 'start':
+                depth += 1
                 continue
+            depth -= 1
+            if depth != 1:
+                continue  # Still inside a top-level child, or the root itself closing
+
+            child_tag = child.tag
+            if child_tag == 'reg-mark':
+                try:
+                    center_x = float(child.get('x')) * scale_factor
+                    center_y = height_mm - (float(child.get('y')) * scale_factor)
+                except (TypeError, ValueError):
+                    print(f"Warning: Skipping a registration mark with invalid coordinates.", file=sys.stderr)
+                    continue
+                top_left_x = center_x - half_mark
+                top_left_y = center_y - half_mark
+                bbox[0] = min(bbox[0], top_left_x)
+                bbox[1] = max(bbox[1], center_x + half_mark)
+                bbox[2] = min(bbox[2], top_left_y)
+                bbox[3] = max(bbox[3], center_y + half_mark)
+                reg_rects.append((top_left_x, top_left_y))
+
+            elif child_tag == 'cut-path':
+                path_index += 1
+                path_string = emit_path(list(child), scale_factor, height_mm, bbox, path_index)
+                if path_string:
+                    path_spool.write(f'<path d="{path_string}" fill="none" stroke="magenta" stroke-width="0.1mm"/>\n')
+
+            # The child has been converted; drop it so memory stays bounded by one path
+            root.clear()
+    except ET.ParseError as e:
+        path_spool.close()
+        print(f"Error: Could not parse XML file. Details: {e}", file=sys.stderr)
+        sys.exit(1)
 
     # Calculate the drawing's center
-    if not all_x_coords or not all_y_coords:
+    min_x, max_x, min_y, max_y = bbox.tolist()
+    if min_x > max_x:
         print("Warning: No valid drawing elements found.", file=sys.stderr)
         drawing_center_x, drawing_center_y = width_mm / 2, height_mm / 2
     else:
-        drawing_center_x = (min(all_x_coords) + max(all_x_coords)) / 2
-        drawing_center_y = (min(all_y_coords) + max(all_y_coords)) / 2
+        drawing_center_x = (min_x + max_x) / 2
+        drawing_center_y = (min_y + max_y) / 2
 
     # --- CENTERING CHANGE: Create the multi-step transform string ---
     canvas_center_x = width_mm / 2
@@ -94,60 +235,26 @@ def convert_xml_to_svg(xml_file, svg_file):
         f'translate({-drawing_center_x:.4f}, {-drawing_center_y:.4f})'
     )
 
-    # --- SVG Generation Pass ---
-    svg_elements = [
-        f'<svg width="{width_mm}mm" height="{height_mm}mm" viewBox="0 0 {width_mm} {height_mm}" xmlns="http://www.w3.org/2000/svg">',
-        '',
-        f'<g transform="{transform_str}">', # Apply the calculated transform
-    ]
-
-    # Process and draw registration marks (coordinates are relative to the transform)
-    for mark in root.findall('reg-mark'):
-        try:
-            center_x = float(mark.get('x')) * scale_factor
-            center_y = height_mm - (float(mark.get('y')) * scale_factor)
-            top_left_x = center_x - (reg_mark_size_mm / 2)
-            top_left_y = center_y - (reg_mark_size_mm / 2)
-            svg_elements.append(f'<rect x="{top_left_x:.4f}" y="{top_left_y:.4f}" width="{reg_mark_size_mm}" height="{reg_mark_size_mm}" fill="black"/>')
-        except (TypeError, ValueError):
-            print(f"Warning: Skipping a registration mark with invalid coordinates.", file=sys.stderr)
-
-    # Process and draw each cut path (coordinates are relative to the transform)
-    for i, path in enumerate(root.findall('cut-path')):
-        path_data = []
-        is_first = True
-        for element in path:
-            try:
-                if element.tag == 'point':
-                    x = float(element.get('x')) * scale_factor
-                    y = height_mm - (float(element.get('y')) * scale_factor)
-                    command = "M" if is_first else "L"
-                    path_data.append(f"{command} {x:.4f} {y:.4f}")
-                    is_first = False
-                elif element.tag == 'spline':
-                    x1 = float(element.get('x1')) * scale_factor
-                    y1 = height_mm - (float(element.get('y1')) * scale_factor)
-                    x2 = float(element.get('x2')) * scale_factor
-                    y2 = height_mm - (float(element.get('y2')) * scale_factor)
-                    x3 = float(element.get('x3')) * scale_factor
-                    y3 = height_mm - (float(element.get('y3')) * scale_factor)
-                    path_data.append(f"C {x1:.4f} {y1:.4f}, {x2:.4f} {y2:.4f}, {x3:.4f} {y3:.4f}")
-            except (TypeError, ValueError):
-                print(f"Warning: Skipping an element in path {i+1} due to invalid coordinates.", file=sys.stderr)
-
-        if path_data:
-            path_data.append("Z")
-            path_string = " ".join(path_data)
-            svg_elements.append(f'<path d="{path_string}" fill="none" stroke="magenta" stroke-width="0.1mm"/>')
-    
-    svg_elements.extend(['</g>', '</svg>'])
-
     # Write the result to the output file
+    f = None
     try:
-        with open(svg_file, 'w') as f:
-            f.write('\n'.join(svg_elements))
+        with path_spool, open(svg_file, 'w', buffering=1 << 20) as f:
+            f.write(f'<svg width="{width_mm}mm" height="{height_mm}mm" viewBox="0 0 {width_mm} {height_mm}" xmlns="http://www.w3.org/2000/svg">\n')
+            f.write('\n')
+            f.write(f'<g transform="{transform_str}">\n') # Apply the calculated transform
+            for top_left_x, top_left_y in reg_rects:
+                f.write(f'<rect x="{top_left_x:.4f}" y="{top_left_y:.4f}" width="{reg_mark_size_mm}" height="{reg_mark_size_mm}" fill="black"/>\n')
+            path_spool.seek(0)
+            shutil.copyfileobj(path_spool, f)
+            f.write('</g>\n</svg>')
         print(f"Successfully converted '{xml_file}' to '{svg_file}'")
     except IOError as e:
+        # Don't leave a truncated SVG behind
+        if f is not None:
+            try:
+                os.remove(svg_file)
+            except OSError:
+                pass
         print(f"Error: Could not write to output file '{svg_file}'. Details: {e}", file=sys.stderr)
         sys.exit(1)
 
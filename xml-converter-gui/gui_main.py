@@ -3,12 +3,39 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinterdnd2 import DND_FILES, TkinterDnD
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import contextlib
+import io
+import multiprocessing
 import os
+import queue
+import sys
+import threading
 
 # Import the conversion function from our other file
 # Ensure converter_logic.py is in the same directory
 from converter_logic import convert_xml_to_svg
 
+def convert_file(input_path, output_path):
+    """
+    Process-pool entry point for convert_xml_to_svg.
+
+    The converter reports failures by printing to stderr and calling sys.exit(), but a
+    worker's stderr never reaches the windowed app, so the last line printed is raised
+    as a RuntimeError for the summary dialog instead.
+    """
+    captured = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(captured):
+            convert_xml_to_svg(input_path, output_path)
+    except SystemExit:
+        lines = [line for line in captured.getvalue().splitlines() if line.strip()]
+        raise RuntimeError(lines[-1] if lines else "conversion failed") from None
+    finally:
+        # Still echo warnings and errors when there is a console to show them
+        if sys.stderr is not None:
+            sys.stderr.write(captured.getvalue())
+
 class App(TkinterDnD.Tk):
     def __init__(self):
         super().__init__()
@@ -17,8 +44,9 @@ class App(TkinterDnD.Tk):
         self.minsize(450, 500)
 
         # --- State Variables ---
-        self.file_paths = set()  # Use a set to automatically handle duplicates
+        self.file_paths = {}  # Dict keys act as an insertion-ordered set, matching the listbox order
         self.output_folder_path = tk.StringVar(value="No output folder selected")
+        self.is_converting = False  # Set while a batch runs on the worker thread
 
         # --- Styling ---
         self.style = ttk.Style(self)
@@ -130,7 +158,7 @@ class App(TkinterDnD.Tk):
         added_count = 0
         for path in filepaths:
             if path.lower().endswith('.xml') and path not in self.file_paths:
-                self.file_paths.add(path)
+                self.file_paths[path] = None
                 self.file_listbox.insert(tk.END, os.path.basename(path))
                 added_count += 1
         if added_count > 0:
@@ -147,7 +175,7 @@ class App(TkinterDnD.Tk):
 
     def check_button_state(self):
         """Enables or disables the Convert button based on state."""
-        if self.file_paths and os.path.isdir(self.output_folder_path.get()):
+        if not self.is_converting and self.file_paths and os.path.isdir(self.output_folder_path.get()):
             self.convert_btn.config(state="normal")
         else:
             self.convert_btn.config(state="disabled")
@@ -160,37 +188,94 @@ class App(TkinterDnD.Tk):
         self.check_button_state()
 
     def start_conversion(self):
-        """The main batch conversion process."""
+        """Starts the batch conversion on a background thread and polls it for progress."""
         output_folder = self.output_folder_path.get()
         files_to_convert = list(self.file_paths)
-        total_files = len(files_to_convert)
 
+        # Lock the controls that change the batch until the worker reports back
+        self.is_converting = True
+        self.convert_btn.config(state="disabled")
+        self.clear_btn.config(state="disabled")
+        self.status_label.config(text=f"Processing {len(files_to_convert)} file(s)...")
+
+        progress_queue = queue.Queue()
+        threading.Thread(
+            target=self._worker,
+            args=(files_to_convert, output_folder, progress_queue),
+            daemon=True
+        ).start()
+        self.after(100, self._poll, progress_queue, len(files_to_convert))
+
+    def _worker(self, files_to_convert, output_folder, progress_queue):
+        """Converts the files on a process pool. Runs off the Tk thread, so it only talks to the queue."""
         success_count = 0
         error_list = []
+        try:
+            with ProcessPoolExecutor(max_workers=min(len(files_to_convert), os.cpu_count() or 1)) as executor:
+                futures = {}
+                output_paths = set()
+                done_count = 0
+                for input_path in files_to_convert:
+                    base_name = os.path.basename(input_path)
+                    output_filename = os.path.splitext(base_name)[0] + '.svg'
+                    output_path = os.path.join(output_folder, output_filename)
+                    # Files with the same name from different folders would map to one SVG,
+                    # and two workers writing it at once could corrupt or delete it
+                    output_key = os.path.normcase(output_path)
+                    if output_key in output_paths:
+                        error_list.append(f"{base_name}: skipped, another staged file is also saved as {output_filename}")
+                        done_count += 1
+                        progress_queue.put(('progress', done_count, base_name))
+                        continue
+                    output_paths.add(output_key)
+                    futures[executor.submit(convert_file, input_path, output_path)] = base_name
 
-        for i, input_path in enumerate(files_to_convert):
-            base_name = os.path.basename(input_path)
-            self.status_label.config(text=f"Processing {i + 1}/{total_files}: {base_name}")
-            self.update_idletasks()
+                for future in as_completed(futures):
+                    base_name = futures[future]
+                    try:
+                        future.result()
+                        success_count += 1
+                    except Exception as e:
+                        error_list.append(f"{base_name}: {e}")
+                    done_count += 1
+                    progress_queue.put(('progress', done_count, base_name))
+        except Exception as e:
+            # e.g. the pool could not start or broke down; report it instead of dying silently
+            error_list.append(f"Batch aborted: {e}")
+        finally:
+            # _poll keeps the controls locked until this arrives, so always send it
+            progress_queue.put(('done', success_count, error_list))
 
+    def _poll(self, progress_queue, total_files):
+        """Drains worker messages on the Tk thread and shows the summary once the batch is done."""
+        while True:
             try:
-                output_filename = os.path.splitext(base_name)[0] + '.svg'
-                output_path = os.path.join(output_folder, output_filename)
-                convert_xml_to_svg(input_path, output_path)
-                success_count += 1
-            except Exception as e:
-                error_list.append(f"{base_name}: {e}")
-
-        summary_message = f"Successfully converted {success_count} of {total_files} files."
-        if error_list:
-            summary_message += "\n\nErrors:\n- " + "\n- ".join(error_list)
-            messagebox.showwarning("Batch Complete with Errors", summary_message)
-        else:
-            messagebox.showinfo("Batch Complete", summary_message)
-            
-        self.status_label.config(text="Conversion complete. Ready.")
+                message = progress_queue.get_nowait()
+            except queue.Empty:
+                self.after(100, self._poll, progress_queue, total_files)
+                return
+
+            if message[0] == 'progress':
+                _, i, base_name = message
+                self.status_label.config(text=f"Processed {i}/{total_files}: {base_name}")
+                continue
 
+            _, success_count, error_list = message
+            summary_message = f"Successfully converted {success_count} of {total_files} files."
+            if error_list:
+                summary_message += "\n\nErrors:\n- " + "\n- ".join(error_list)
+                messagebox.showwarning("Batch Complete with Errors", summary_message)
+            else:
+                messagebox.showinfo("Batch Complete", summary_message)
+
+            self.status_label.config(text="Conversion complete. Ready.")
+            self.is_converting = False
+            self.clear_btn.config(state="normal")
+            self.check_button_state()
+            return
 
 if __name__ == "__main__":
+    # Needed for the worker processes when running as a frozen executable
+    multiprocessing.freeze_support()
     app = App()
     app.mainloop()
\ No newline at end of file
@@ -0,0 +1,13 @@
+# setup.py
+#
+# Builds the optional Cython extension used by converter_logic.py:
+#     python setup.py build_ext --inplace
+# Without it the converter falls back to the pure-Python emitter.
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="xml-converter-gui-extensions",
+    ext_modules=cythonize("converter_fast.pyx"),
+)
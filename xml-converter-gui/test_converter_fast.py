@@ -0,0 +1,114 @@
+# test_converter_fast.py
+#
+# converter_fast.emit_path is a hand-written Cython copy of
+# converter_logic._py_emit_path and silently replaces it once built, so the two
+# must produce identical path data and bounding boxes.
+# Build the extension first: python setup.py build_ext --inplace
+# Run with: python -m pytest xml-converter-gui
+
+import glob
+import os
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+
+converter_fast = pytest.importorskip("converter_fast")
+import converter_logic
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "input")
+
+EDGE_CASES_XML = """<cut-list units="hundredths_mm" width="1000" height="800">
+    <cut-path>
+        <!-- a comment inside the path -->
+        <point x="200" y="200"/>
+        <?marker processing-instruction?>
+        <point x="-300.5" y="250"/>
+        <spline x1="400" y1="300" x2="500" y2="350" x3="600" y3="400"/>
+    </cut-path>
+    <cut-path>
+        <point x="1e3" y="-.25"/>
+        <point y="250"/>
+        <point x="abc" y="1"/>
+        <spline x1="400" y1="300" x2="500" y2="350" x3="600"/>
+        <spline x1="400" y1="300" x2="oops" y2="350" x3="600" y3="400"/>
+        <unknown x="1" y="2"/>
+        <point x="0.00005" y="799.99995"/>
+    </cut-path>
+    <cut-path>
+        <spline x1="1" y1="2" x2="3" y2="4" x3="5" y3="6"/>
+        <point x="7" y="8"/>
+    </cut-path>
+    <cut-path>
+        <point x="bad" y="bad"/>
+        <!-- only invalid elements and comments -->
+    </cut-path>
+    <cut-path></cut-path>
+</cut-list>
+"""
+
+
+@pytest.fixture(params=["python-formatter", "numba-kernel"])
+def py_emit_path(request, monkeypatch):
+    """converter_logic._py_emit_path, with either of its two formatters."""
+    if request.param == "numba-kernel":
+        kernels = pytest.importorskip("converter_kernels")
+        monkeypatch.setattr(converter_logic, "format_path", kernels.format_path)
+        monkeypatch.setattr(converter_logic, "MAX_ABS_VALUE", kernels.MAX_ABS_VALUE, raising=False)
+        monkeypatch.setattr(converter_logic, "BYTES_PER_COORDINATE", kernels.BYTES_PER_COORDINATE, raising=False)
+    else:
+        monkeypatch.setattr(converter_logic, "format_path", None)
+    return converter_logic._py_emit_path
+
+
+def _parse_with_comments(source):
+    parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True, insert_pis=True))
+    parser.feed(source)
+    return parser.close()
+
+
+def _assert_emitters_agree(root, py_emit_path, scale, height, capsys):
+    fast_bbox = np.array([np.inf, -np.inf, np.inf, -np.inf])
+    py_bbox = fast_bbox.copy()
+    for path_number, cut_path in enumerate(root.iter('cut-path'), start=1):
+        elements = list(cut_path)
+        fast_path = converter_fast.emit_path(elements, scale, height, fast_bbox, path_number)
+        fast_warnings = capsys.readouterr().err
+        py_path = py_emit_path(elements, scale, height, py_bbox, path_number)
+        py_warnings = capsys.readouterr().err
+        assert fast_path == py_path, f"path {path_number}"
+        assert fast_warnings == py_warnings, f"path {path_number}"
+        assert np.array_equal(fast_bbox, py_bbox), f"path {path_number}"
+
+        # Also compare each path's own extents, which a shared bbox can mask
+        fresh_fast = np.array([np.inf, -np.inf, np.inf, -np.inf])
+        fresh_py = fresh_fast.copy()
+        converter_fast.emit_path(elements, scale, height, fresh_fast, path_number)
+        py_emit_path(elements, scale, height, fresh_py, path_number)
+        capsys.readouterr()
+        assert np.array_equal(fresh_fast, fresh_py), f"path {path_number}"
+    return fast_bbox
+
+
+@pytest.mark.parametrize("xml_file", sorted(glob.glob(os.path.join(INPUT_DIR, "*.xml"))))
+def test_sample_input_matches(xml_file, py_emit_path, capsys):
+    root = ET.parse(xml_file).getroot()
+    scale = 25.4 if root.get('units') == 'inches' else 0.01
+    height = float(root.get('height')) * scale
+    bbox = _assert_emitters_agree(root, py_emit_path, scale, height, capsys)
+    assert np.isfinite(bbox).all()
+
+
+def test_edge_cases_match(py_emit_path, capsys):
+    root = _parse_with_comments(EDGE_CASES_XML)
+    _assert_emitters_agree(root, py_emit_path, 0.01, 8.0, capsys)
+
+
+def test_empty_and_invalid_paths_leave_bbox_untouched(py_emit_path, capsys):
+    root = _parse_with_comments(EDGE_CASES_XML)
+    invalid_path, empty_path = list(root.iter('cut-path'))[-2:]
+    for emit in (converter_fast.emit_path, py_emit_path):
+        for cut_path in (invalid_path, empty_path):
+            bbox = np.array([np.inf, -np.inf, np.inf, -np.inf])
+            assert emit(list(cut_path), 0.01, 8.0, bbox, 1) == ""
+            assert bbox.tolist() == [np.inf, -np.inf, np.inf, -np.inf]
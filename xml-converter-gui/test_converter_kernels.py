@@ -0,0 +1,62 @@
+# test_converter_kernels.py
+#
+# Regression check for the hand-rolled number formatter in converter_kernels:
+# its output must match '{:.4f}' for every value it is allowed to format.
+# Run with: python -m pytest xml-converter-gui
+
+import numpy as np
+import pytest
+
+kernels = pytest.importorskip("converter_kernels")
+
+
+def _kernel_format(values):
+    """Formats values as a chain of 'L x x' commands and returns the kernel's numbers."""
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    out_buf = np.empty(len(values) * kernels.BYTES_PER_COORDINATE + 2, dtype=np.uint8)
+    cmds = np.full(len(values), ord('L'), dtype=np.uint8)
+    n = kernels.format_path(values, values, out_buf, cmds)
+    return bytes(out_buf[:n]).decode('ascii').split()[1::3]
+
+
+def _assert_matches_str_format(values):
+    mismatches = [
+        (expected, got)
+        for expected, got in zip(("{:.4f}".format(v) for v in values.tolist()), _kernel_format(values))
+        if expected != got
+    ]
+    assert not mismatches, mismatches[:10]
+
+
+def test_random_values_match_str_format():
+    rng = np.random.default_rng(0)
+    _assert_matches_str_format(np.concatenate([
+        rng.uniform(-3000, 3000, 100000),
+        rng.uniform(-kernels.MAX_ABS_VALUE, kernels.MAX_ABS_VALUE, 100000),
+        np.exp(rng.uniform(0, np.log(kernels.MAX_ABS_VALUE), 100000)),
+    ]))
+
+
+def test_ties_and_signed_zero_match_str_format():
+    rng = np.random.default_rng(1)
+    _assert_matches_str_format(np.concatenate([
+        # Decimal ties at the fifth place, as produced by typical unit scaling
+        rng.integers(-3000000, 3000000, 50000) * 0.00005,
+        rng.integers(-300000, 300000, 50000) * 0.01 * 25.4,
+        np.array([0.0, -0.0, -0.00001, 0.00005, 0.00015, 0.5, 2.5, 99999.99995]),
+    ]))
+
+
+def test_values_just_below_the_bound_match_str_format():
+    below_bound = np.nextafter(kernels.MAX_ABS_VALUE, 0.0)
+    steps = np.arange(200000, dtype=np.float64)
+    values = below_bound - steps * np.spacing(below_bound)
+    _assert_matches_str_format(np.concatenate([values, -values]))
+
+
+def test_buffer_size_covers_the_widest_numbers():
+    widest = -np.nextafter(kernels.MAX_ABS_VALUE, 0.0)
+    xs = np.full(3, widest)
+    out_buf = np.empty(len(xs) * kernels.BYTES_PER_COORDINATE + 2, dtype=np.uint8)
+    n = kernels.format_path(xs, xs, out_buf, np.array([ord('C')], dtype=np.uint8))
+    assert n <= len(out_buf)
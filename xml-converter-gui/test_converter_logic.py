@@ -0,0 +1,65 @@
+# test_converter_logic.py
+#
+# The compiled helpers (converter_fast, converter_kernels) are optional: the
+# converter must still import and convert when they are missing or broken.
+# Run with: python -m pytest xml-converter-gui
+
+import importlib
+import sys
+
+import pytest
+
+SAMPLE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<cut-list units="hundredths_mm" width="1000" height="800">
+    <reg-mark x="100" y="100"/>
+    <cut-path>
+        <point x="200" y="200"/>
+        <point x="300" y="250"/>
+        <spline x1="400" y1="300" x2="500" y2="350" x3="600" y3="400"/>
+    </cut-path>
+</cut-list>
+"""
+
+
+def _import_converter_logic(monkeypatch, kernels_source=None):
+    """
+    Re-imports converter_logic without the Cython emitter, so the converter_kernels
+    import runs. kernels_source replaces converter_kernels; None makes it unimportable.
+    """
+    monkeypatch.setitem(sys.modules, "converter_fast", None)
+    monkeypatch.delitem(sys.modules, "converter_logic", raising=False)
+    if kernels_source is None:
+        monkeypatch.setitem(sys.modules, "converter_kernels", None)
+    else:
+        monkeypatch.delitem(sys.modules, "converter_kernels", raising=False)
+        monkeypatch.syspath_prepend(str(kernels_source))
+    return importlib.import_module("converter_logic")
+
+
+def _convert_sample(converter_logic, tmp_path):
+    xml_file = tmp_path / "sample.xml"
+    svg_file = tmp_path / "sample.svg"
+    xml_file.write_text(SAMPLE_XML)
+    converter_logic.convert_xml_to_svg(str(xml_file), str(svg_file))
+    return svg_file.read_text()
+
+
+def test_converts_without_kernels(monkeypatch, tmp_path):
+    converter_logic = _import_converter_logic(monkeypatch)
+    assert converter_logic.format_path is None
+    assert converter_logic.emit_path is converter_logic._py_emit_path
+    svg = _convert_sample(converter_logic, tmp_path)
+    assert '<path d="M 2.0000 6.0000 L 3.0000 5.5000 C 4.0000 5.0000, 5.0000 4.5000, 6.0000 4.0000 Z"' in svg
+
+
+def test_converts_when_kernels_fail_to_compile(monkeypatch, tmp_path):
+    # Numba raises RuntimeError at decoration time when it has no source to cache
+    # against, which is what happens inside a frozen (PyInstaller) build
+    kernels_dir = tmp_path / "kernels"
+    kernels_dir.mkdir()
+    (kernels_dir / "converter_kernels.py").write_text(
+        "raise RuntimeError(\"cannot cache function '_product_error': no locator available\")\n"
+    )
+    converter_logic = _import_converter_logic(monkeypatch, kernels_dir)
+    assert converter_logic.format_path is None
+    assert "<path " in _convert_sample(converter_logic, tmp_path)